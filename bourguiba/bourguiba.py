@@ -1,71 +1,179 @@
 import os
-from transformers import T5Tokenizer, T5ForConditionalGeneration
 import subprocess
 import platform
+import select
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+EXIT_COMMANDS = ('quit', 'exit')
+BATCH_SIZE = 16  # Most descriptions run through the model at once
 
 class Bourguiba:
     def __init__(self):
         self.model_name = 'google/flan-t5-small'
         self.model_dir = os.path.expanduser("~/.bourguiba_model")
+        self.system_platform = platform.system()  # The OS can't change within a run
+
+        # Generation is greedy, so the same description always yields the same command
+        self.command_cache = OrderedDict()
+        self.cache_size = 256
 
-        # Download and cache the model locally
-        self.tokenizer = T5Tokenizer.from_pretrained(self.model_name, cache_dir=self.model_dir)
-        self.model = T5ForConditionalGeneration.from_pretrained(self.model_name, cache_dir=self.model_dir)
+        # transformers is slow to import, so only load it once a model is needed
+        from transformers import T5TokenizerFast, T5ForConditionalGeneration
+
+        # Download and cache the model locally; tokenizer and weights load in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tokenizer = executor.submit(self.load_pretrained, T5TokenizerFast)
+            model = executor.submit(self.load_pretrained, T5ForConditionalGeneration)
+            self.tokenizer = tokenizer.result()
+            self.model = model.result()
+
+    def load_pretrained(self, model_class):
+        # Use the local cache without asking the Hub for updates. Any local failure
+        # (missing files, or a cache from the slow tokenizer that can't be converted)
+        # falls back to a normal download
+        try:
+            return model_class.from_pretrained(self.model_name, cache_dir=self.model_dir, local_files_only=True)
+        except Exception:
+            return model_class.from_pretrained(self.model_name, cache_dir=self.model_dir)
 
     def generate_command(self, description):
-        # Prepare the input for the model
-        input_text = f"Generate command: {description}"
-        input_ids = self.tokenizer.encode(input_text, return_tensors="pt")
+        return self.generate_commands([description])[0]
 
-        # Generate the command
-        output_ids = self.model.generate(input_ids, max_length=50)
-        command = self.tokenizer.decode(output_ids[0], skip_special_tokens=True)
-        
-        # Clean up the generated command for execution
-        cleaned_command = self.clean_command(command)
-        return cleaned_command
+    def generate_commands(self, descriptions):
+        descriptions = [self.normalize_description(d) for d in descriptions]
+
+        # Only run the model for descriptions that aren't empty or cached yet
+        pending = [d for d in dict.fromkeys(descriptions) if d and d not in self.command_cache]
+        if pending:
+            import torch  # Already loaded by transformers at this point
+
+        # Bounded slices keep padded batches from growing with the input size
+        for start in range(0, len(pending), BATCH_SIZE):
+            batch = pending[start:start + BATCH_SIZE]
+
+            # Prepare the inputs for the model, padded so they run as one batch
+            input_texts = [f"Generate command: {description}" for description in batch]
+            inputs = self.tokenizer(input_texts, return_tensors="pt", padding=True)
+
+            # Generate the whole batch in a single forward pass
+            with torch.inference_mode():
+                output_ids = self.model.generate(**inputs, max_length=50)
+            commands = self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+
+            # Clean up the generated commands for execution
+            for description, command in zip(batch, commands):
+                self.command_cache[description] = self.clean_command(command)
+
+        cleaned_commands = []
+        for description in descriptions:
+            if not description:
+                cleaned_commands.append('')
+                continue
+            self.command_cache.move_to_end(description)
+            cleaned_commands.append(self.command_cache[description])
+
+        # Evict the least recently used commands
+        while len(self.command_cache) > self.cache_size:
+            self.command_cache.popitem(last=False)
+        return cleaned_commands
+
+    def normalize_description(self, description):
+        # Extra whitespace doesn't change the command; punctuation and case are kept
+        # because paths like '..' and case-sensitive file names do
+        return ' '.join(description.split())
 
     def clean_command(self, command):
         # Implement basic cleaning logic to make the command valid
         command = command.strip()
 
-        # Platform-specific command adjustments
-        system_platform = platform.system()
-
-        if system_platform == 'Linux':
-            # Ubuntu-specific adjustments (add any custom command mappings here)
-            if command.startswith("Create a folder"):
-                command = command.replace("Create a folder", "mkdir")
-        elif system_platform == 'Darwin':
-            # macOS-specific adjustments
-            if command.startswith("Create a folder"):
-                command = command.replace("Create a folder", "mkdir")
-        elif system_platform == 'Windows':
-            # Windows-specific adjustments
-            if command.startswith("Create a folder"):
-                command = command.replace("Create a folder", "mkdir")
+        # The mapping is shared by Linux, macOS and Windows; only the
+        # platform-specific suffix differs (add custom command mappings here)
+        if command.startswith("Create a folder"):
+            command = command.replace("Create a folder", "mkdir")
+            if self.system_platform == 'Windows':
                 command += " -Force"  # Windows might need force for certain operations
 
         return command
 
+def run_command(command):
+    # Execute the command with our stdout/stderr so its output streams as it is produced
+    print("Output:", flush=True)
+    result = subprocess.run(command, shell=True)
+    if result.returncode != 0:
+        print(f"Error executing command: exit status {result.returncode}")
+
+def read_batches(stream, batch_size=BATCH_SIZE):
+    # Yield piped descriptions, stopping at 'quit' or 'exit'. A batch is cut as soon as
+    # the pipe has nothing more ready, so slow input runs line by line while files and
+    # heredocs are still generated in batches
+    if os.name == 'nt':
+        # select() can't poll pipes on Windows, so handle one line at a time
+        for line in stream:
+            description = line.strip()
+            if description.lower() in EXIT_COMMANDS:
+                return
+            if description:
+                yield [description]
+        return
+
+    # Read the raw descriptor: sys.stdin's own buffer can't be checked for pending lines
+    fd = stream.fileno()
+    encoding = stream.encoding or 'utf-8'
+    buffer = b''
+    batch = []
+    while True:
+        chunk = os.read(fd, 65536)
+        lines = (buffer + chunk).split(b'\n')
+        buffer = lines.pop() if chunk else b''  # Keep a partial line until EOF
+        for line in lines:
+            description = line.decode(encoding, errors='replace').strip()
+            if description.lower() in EXIT_COMMANDS:
+                if batch:
+                    yield batch
+                return
+            if description:
+                batch.append(description)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if not chunk:
+            break
+        if batch and not select.select([fd], [], [], 0)[0]:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 def main():
     bourguiba = Bourguiba()
-    print("Enter your command description (or 'quit' to exit):")
+
+    # Piped input (scripts, CI) gets no prompt text; each batch runs before the next is read
+    if not sys.stdin.isatty():
+        for descriptions in read_batches(sys.stdin):
+            for command in bourguiba.generate_commands(descriptions):
+                print(f"Generated command: {command}")
+                run_command(command)
+        return
+
+    print("Enter your command description (or 'quit'/'exit' to exit):")
     
     while True:
-        description = input("> ")
-        if description.lower() == 'quit':
+        try:
+            description = input("> ")
+        except EOFError:
+            break
+
+        description = description.strip()
+        if not description:
+            continue
+        if description.lower() in EXIT_COMMANDS:
             break
         
         command = bourguiba.generate_command(description)
         print(f"Generated command: {command}")
-
-        # Execute the command and capture output
-        try:
-            result = subprocess.run(command, shell=True, check=True, text=True, capture_output=True)
-            print("Output:", result.stdout)
-        except subprocess.CalledProcessError as e:
-            print("Error executing command:", e.stderr)
+        run_command(command)
 
 if __name__ == "__main__":
     main()
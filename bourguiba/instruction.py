@@ -1,20 +1,47 @@
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+import re
+
+# Lines of the model output that hold a platform-specific command
+PLATFORM_LINE_RE = re.compile(r'^(?:Linux|Mac|Windows):.*$', re.MULTILINE)
+
+# Total tokens (prompt + generated) allowed for a single description
+MAX_LENGTH = 150
 
 class CommandGenerator:
     def __init__(self, model_dir):
+        # transformers is slow to import, so only load it once a model is needed
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
         self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
         self.model = AutoModelForCausalLM.from_pretrained(model_dir)
         self.model.eval()
 
+        # Batches are left-padded so every prompt ends where generation starts
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
     def generate_command(self, description):
-        input_text = f"Generate shell commands for Linux, Mac, and Windows:\n{description}\n"
-        input_ids = self.tokenizer.encode(input_text, return_tensors="pt")
+        return self.generate_commands([description])[0]
+
+    def generate_commands(self, descriptions):
+        if not descriptions:
+            return []
+
+        import torch  # Already loaded by transformers at this point
+
+        input_texts = [f"Generate shell commands for Linux, Mac, and Windows:\n{description}\n" for description in descriptions]
+        inputs = self.tokenizer(input_texts, return_tensors="pt", padding=True)
+
+        # Padding doesn't count towards a prompt's budget, so give the batch enough
+        # new tokens for its shortest prompt and trim the others back below
+        prompt_lengths = inputs["attention_mask"].sum(dim=1).tolist()
+        padded_length = inputs["input_ids"].shape[1]
 
         with torch.no_grad():
             output_ids = self.model.generate(
-                input_ids,
-                max_length=150,
+                **inputs,
+                pad_token_id=self.tokenizer.pad_token_id,
+                max_new_tokens=max(MAX_LENGTH - min(prompt_lengths), 1),
                 num_return_sequences=1,
                 no_repeat_ngram_size=2,
                 do_sample=True,
@@ -23,13 +50,12 @@ class CommandGenerator:
                 temperature=0.7
             )
 
-        commands = self.tokenizer.decode(output_ids[0], skip_special_tokens=True)
-        return self.clean_commands(commands)
+        output_ids = [
+            row[:padded_length + max(MAX_LENGTH - prompt_length, 1)]
+            for row, prompt_length in zip(output_ids, prompt_lengths)
+        ]
+        commands = self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+        return [self.clean_commands(command) for command in commands]
 
     def clean_commands(self, commands):
-        lines = commands.split('\n')
-        cleaned = []
-        for line in lines:
-            if line.startswith(('Linux:', 'Mac:', 'Windows:')):
-                cleaned.append(line.strip())
-        return '\n'.join(cleaned)
\ No newline at end of file
+        return '\n'.join(line.strip() for line in PLATFORM_LINE_RE.findall(commands))
\ No newline at end of file
@@ -1,20 +1,24 @@
 import os
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
 
 def download_model():
     model_name = "distilgpt2"
     model_dir = os.path.join(os.path.expanduser("~"), ".bourguiba_model")
 
-    if not os.path.exists(model_dir):
-        os.makedirs(model_dir)
+    os.makedirs(model_dir, exist_ok=True)
 
-    if not os.path.exists(os.path.join(model_dir, "pytorch_model.bin")):
+    # Older versions saved pytorch_model.bin; the Hub snapshot ships safetensors
+    weights = ("model.safetensors", "pytorch_model.bin")
+    if not any(os.path.exists(os.path.join(model_dir, name)) for name in weights):
+        # Installed with transformers, but far cheaper to import
+        from huggingface_hub import snapshot_download
+
+        # Fetch the files as published instead of loading and re-saving the model
         print(f"Downloading model '{model_name}' to '{model_dir}'...")
-        model = AutoModelForCausalLM.from_pretrained(model_name)
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
-        model.save_pretrained(model_dir)
-        tokenizer.save_pretrained(model_dir)
+        snapshot_download(
+            repo_id=model_name,
+            local_dir=model_dir,
+            allow_patterns=["*.json", "*.safetensors", "merges.txt"]
+        )
         print("Model downloaded and saved.")
     else:
         print("Model already exists. Loading from local directory.")
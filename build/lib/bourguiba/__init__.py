@@ -1,5 +0,0 @@
-# This file can be left empty or include package-level docstring
-"""
-Bourguiba: A package for generating shell commands based on descriptions.
-"""
-from .bourguiba import main  # Import main function for command line execution